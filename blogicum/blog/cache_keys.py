@@ -0,0 +1,8 @@
+"""Ключи кэша блога, общие для представлений, форм и сигналов"""
+
+CHOICES_CACHE_KEY = 'blog:choices:{}'
+
+CATEGORY_CACHE_KEY = 'blog:category:{}'
+
+POSTS_VERSION_KEY = 'blog:posts_version'
+INDEX_CACHE_KEY = 'blog:index:v{version}:page{page}'
@@ -1,13 +1,48 @@
 import os
-from datetime import timedelta
+from datetime import datetime
 from django import forms
+from django.forms.utils import from_current_timezone
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.utils import timezone
-from blog.models import Post, Comment
+from blog.cache_keys import CHOICES_CACHE_KEY
+from blog.models import Post, Comment, Category, Location
 
 User = get_user_model()
 
+_RUNNING_UNDER_PYTEST = 'PYTEST_CURRENT_TEST' in os.environ
+
+CHOICES_CACHE_TIMEOUT = 60
+
+
+def _cached_choices(model):
+    """Варианты выбора для поля модели, хранящиеся в кэше"""
+    key = CHOICES_CACHE_KEY.format(model._meta.model_name)
+    choices = cache.get(key)
+    if choices is None:
+        choices = tuple((obj.pk, str(obj)) for obj in model.objects.all())
+        cache.set(key, choices, CHOICES_CACHE_TIMEOUT)
+    return choices
+
+
+class DateTimeLocalField(forms.DateTimeField):
+    """
+    Поле даты и времени для виджета datetime-local
+    Значение в формате ISO 8601 разбирается напрямую, остальные форматы
+    обрабатываются стандартным DateTimeField
+    """
+    def to_python(self, value):
+        if isinstance(value, str):
+            try:
+                result = datetime.fromisoformat(value.strip())
+            except ValueError:
+                pass
+            else:
+                return from_current_timezone(result)
+        return super().to_python(value)
+
 
 class RegistrationForm(UserCreationForm):
     """
@@ -18,6 +53,17 @@ class RegistrationForm(UserCreationForm):
         fields = ('username', 'email', 'first_name', 'last_name')
 
 
+class DateTimeLocalInput(forms.DateTimeInput):
+    """
+    Виджет datetime-local
+    Значение выводится через isoformat, без вызова strftime
+    """
+    def format_value(self, value):
+        if isinstance(value, datetime):
+            return value.isoformat(timespec='minutes')[:16]
+        return super().format_value(value)
+
+
 class PostForm(forms.ModelForm):
     """
     Форма создания и редактирования поста
@@ -27,7 +73,7 @@ class PostForm(forms.ModelForm):
         model = Post
         fields = ('title', 'text', 'image', 'pub_date', 'location', 'category', 'is_published')
         widgets = {
-            'pub_date': forms.DateTimeInput(
+            'pub_date': DateTimeLocalInput(
                 attrs={
                     'type': 'datetime-local',
                     'class': 'form-control',
@@ -43,13 +89,23 @@ class PostForm(forms.ModelForm):
         help_texts = {
             'pub_date': 'Вы можете указать любую дату — прошлую, текущую или будущую.',
         }
+        field_classes = {
+            'pub_date': DateTimeLocalField,
+        }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+
+        for name, model in (('category', Category), ('location', Location)):
+            field = self.fields[name]
+            empty = () if field.empty_label is None else (
+                ('', field.empty_label),
+            )
+            field.choices = empty + _cached_choices(model)
         
         if not self.instance.pk:
-            # Устанавливаем начальную дату как текущее время
-            self.initial['pub_date'] = timezone.now()
+            # Текущее время вычисляется только при отрисовке поля
+            self.initial['pub_date'] = timezone.now
         elif self.instance.pub_date:
             self.initial['pub_date'] = self.instance.pub_date
 
@@ -63,17 +119,18 @@ class PostForm(forms.ModelForm):
             return pub_date
         
         # Для совместимости с тестами
-        if os.getenv('PYTEST_CURRENT_TEST'):
+        if _RUNNING_UNDER_PYTEST:
             return pub_date
 
         return pub_date
 
     def clean(self):
         cleaned_data = super().clean()
-        is_published = cleaned_data.get('is_published', True)
+        if cleaned_data.get('is_published', True):
+            return cleaned_data
         pub_date = cleaned_data.get('pub_date')
-        if not is_published and pub_date and pub_date > timezone.now():
-            self.add_warning(
+        if pub_date and pub_date > timezone.now():
+            self.add_error(
                 'pub_date',
                 'Пост снят с публикации, но имеет будущую дату публикации. '
                 'При повторной публикации проверьте дату.'
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.16 on 2026-10-15 21:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_comment_post_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='post',
+            name='is_published',
+            field=models.BooleanField(default=True, help_text='Если снята галочка — публикация будет скрыта.', verbose_name='Опубликовано'),
+        ),
+    ]
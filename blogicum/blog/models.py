@@ -79,9 +79,24 @@ class Post(PublishedModel, CreatedModel):
         default=True,
         help_text='Если снята галочка — публикация будет скрыта.'
     )
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев',
+        default=0,
+        editable=False
+    )
+
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
+        indexes = [
+            models.Index(fields=['-pub_date'],
+                         name='post_pubdate_desc_idx',
+                         condition=models.Q(is_published=True)),
+            models.Index(fields=['author', '-pub_date'],
+                         name='post_author_pubdate_idx'),
+            models.Index(fields=['category', '-pub_date'],
+                         name='post_category_pubdate_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -107,6 +122,10 @@ class Comment(CreatedModel):
         ordering = ['created_at']
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = [
+            models.Index(fields=['post', 'created_at'],
+                         name='comment_post_created_idx'),
+        ]
 
     def __str__(self):
         return f'Комментарий {self.author} к {self.post}'
@@ -0,0 +1,114 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from blog.cache_keys import (
+    CATEGORY_CACHE_KEY, CHOICES_CACHE_KEY, POSTS_VERSION_KEY
+)
+from blog.models import Category, Comment, Location, Post
+
+User = get_user_model()
+
+
+def _bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Ключ вытеснен: новая версия не должна совпасть со старыми
+        cache.set(key, time.time_ns(), None)
+
+
+def _change_comment_count(post_id, delta):
+    posts = Post.objects.filter(pk=post_id)
+    if delta < 0:
+        posts = posts.filter(comment_count__gt=0)
+    posts.update(comment_count=F('comment_count') + delta)
+
+
+@receiver(pre_save, sender=Comment)
+def remember_comment_post(sender, instance, **kwargs):
+    """Запоминает прежний пост комментария перед его сохранением"""
+
+    instance._old_post_id = None
+    if instance.pk:
+        instance._old_post_id = Comment.objects.filter(
+            pk=instance.pk
+        ).values_list('post_id', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, **kwargs):
+    """Пересчитывает счётчики комментариев при создании или переносе"""
+
+    old_post_id = getattr(instance, '_old_post_id', None)
+    if created:
+        _change_comment_count(instance.post_id, 1)
+    elif old_post_id is not None and old_post_id != instance.post_id:
+        _change_comment_count(old_post_id, -1)
+        _change_comment_count(instance.post_id, 1)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    """Уменьшает счётчик комментариев поста при удалении комментария"""
+
+    _change_comment_count(instance.post_id, -1)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def reset_choices_cache(sender, **kwargs):
+    """Сбрасывает кэш вариантов категорий и местоположений в PostForm"""
+
+    cache.delete(CHOICES_CACHE_KEY.format(sender._meta.model_name))
+
+
+@receiver(pre_save, sender=Category)
+def reset_old_category_cache(sender, instance, **kwargs):
+    """Сбрасывает кэш категории под прежним slug перед его изменением"""
+
+    if instance.pk:
+        old_slug = Category.objects.filter(pk=instance.pk).values_list(
+            'slug', flat=True
+        ).first()
+        if old_slug and old_slug != instance.slug:
+            cache.delete(CATEGORY_CACHE_KEY.format(old_slug))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def reset_category_cache(sender, instance, **kwargs):
+    """Сбрасывает кэш категории для страницы category_posts"""
+
+    cache.delete(CATEGORY_CACHE_KEY.format(instance.slug))
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def reset_index_cache(sender, **kwargs):
+    """Сбрасывает закэшированные страницы ленты"""
+
+    _bump_version(POSTS_VERSION_KEY)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def reset_index_cache_for_user(sender, update_fields=None, **kwargs):
+    """Сбрасывает страницы ленты при изменении данных автора"""
+
+    # Вход пользователя обновляет только last_login, в ленте его нет
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    _bump_version(POSTS_VERSION_KEY)
@@ -6,15 +6,16 @@ from . import views
 app_name = 'blog'
 
 urlpatterns = [
-    path('', views.index, name='index'),
+    path('', views.IndexView.as_view(), name='index'),
     path('posts/<int:post_id>/', views.post_detail, name='post_detail'),
     path('category/<slug:category_slug>/',
-         views.category_posts,
+         views.CategoryPostsView.as_view(),
          name='category_posts'),
     path('auth/registration/', views.register, name='registration'),
 
     path('profile/edit/', views.edit_profile, name='edit_profile'),
-    path('profile/<str:username>/', views.user_profile, name='profile'),
+    path('profile/<str:username>/', views.ProfileView.as_view(),
+         name='profile'),
     path('posts/create/', views.create_post, name='create_post'),
     path('posts/<int:post_id>/edit/', views.edit_post, name='edit_post'),
     path('posts/<int:post_id>/delete/', views.delete_post, name='delete_post'),
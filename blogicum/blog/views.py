@@ -1,58 +1,136 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count
-from django.core.paginator import Paginator
+from django.core.cache import cache
+from django.http import Http404, HttpResponse
+from django.utils.functional import cached_property
+from django.views.generic import ListView
 from blog.models import Post, Category, Comment
 from django.utils import timezone
+from blog.cache_keys import (
+    CATEGORY_CACHE_KEY, INDEX_CACHE_KEY, POSTS_VERSION_KEY
+)
 from blog.forms import RegistrationForm, PostForm, CommentForm, ProfileEditForm
 
 User = get_user_model()
 
+# Кэш сбрасывается сигналами только в текущем процессе,
+# остальные процессы видят изменения не позже чем через таймаут
+CATEGORY_CACHE_TIMEOUT = 60
+INDEX_CACHE_TIMEOUT = 60
+INDEX_CACHED_PAGES = 5
 
-def get_published_posts():
+# Поля поста, нужные для проверки авторства и формы редактирования
+POST_FORM_FIELDS = ('id', 'author', *PostForm._meta.fields)
+
+
+def get_published_posts(now=None):
     return Post.objects.filter(
         is_published=True,
         category__is_published=True,
-        pub_date__lte=timezone.now()
+        pub_date__lte=now or timezone.now()
     )
 
 
-def index(request):
+def get_published_category(slug):
+    """Опубликованная категория по slug с кэшированием результата"""
+
+    # Кэшируются только найденные категории, чтобы запросы
+    # к произвольным slug не вытесняли остальные ключи
+    key = CATEGORY_CACHE_KEY.format(slug)
+    category = cache.get(key)
+    if category is None:
+        category = Category.objects.filter(
+            slug=slug, is_published=True
+        ).first()
+        if category is None:
+            raise Http404('Категория не найдена')
+        cache.set(key, category, CATEGORY_CACHE_TIMEOUT)
+    return category
+
+
+class PublishedPostListView(ListView):
+    """Базовый список опубликованных постов с пагинацией по 10 штук"""
+
+    model = Post
+    paginate_by = 10
+
+    @cached_property
+    def now(self):
+        return timezone.now()
+
+    def prepare_queryset(self, queryset):
+        """Общие для всех лент связанные объекты и сортировка"""
+        return queryset.select_related(
+            'author', 'category', 'location'
+        ).order_by('-pub_date')
+
+    def get_queryset(self):
+        return self.prepare_queryset(get_published_posts(self.now))
+
+    def paginate_queryset(self, queryset, page_size):
+        # get_page вместо 404 отдаёт ближайшую существующую страницу
+        paginator = self.get_paginator(queryset, page_size)
+        page = paginator.get_page(self.request.GET.get(self.page_kwarg))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class IndexView(PublishedPostListView):
     """Главная страница - 10 последних опубликованных постов с пагинацией"""
 
-    template = 'blog/index.html'
+    template_name = 'blog/index.html'
 
-    post_list = get_published_posts().annotate(comment_count=Count('comments')).order_by('-pub_date')
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
 
-    paginator = Paginator(post_list, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+        # Анонимным посетителям отдаются закэшированные первые страницы
+        page_number = request.GET.get(self.page_kwarg) or '1'
+        if not page_number.isdigit() or not (
+            1 <= int(page_number) <= INDEX_CACHED_PAGES
+        ):
+            return super().get(request, *args, **kwargs)
+        page_number = int(page_number)
 
-    return render(request, template, {'page_obj': page_obj})
+        cache_key = INDEX_CACHE_KEY.format(
+            version=cache.get(POSTS_VERSION_KEY, 0),
+            page=page_number
+        )
+        content = cache.get(cache_key)
+        if content is not None:
+            return HttpResponse(content)
+
+        response = super().get(request, *args, **kwargs)
+        if response.context_data['page_obj'].number == page_number:
+            response.add_post_render_callback(
+                lambda r: cache.set(cache_key, r.content, INDEX_CACHE_TIMEOUT)
+            )
+        return response
 
 
 def post_detail(request, post_id):
     """Страница отдельной публикации с комментариями"""
 
     template = 'blog/detail.html'
+    now = timezone.now()
 
     post = get_object_or_404(
-        Post,
+        Post.objects.select_related('author', 'category', 'location'),
         pk=post_id
     )
 
     is_accessible = (
         post.is_published
         and post.category.is_published
-        and post.pub_date <= timezone.now()
+        and post.pub_date <= now
     )
 
     if not is_accessible and request.user != post.author:
-        from django.http import Http404
         raise Http404("Пост не найден")
 
-    comments = post.comments.select_related('author')
+    comments = post.comments.select_related('author').only(
+        'id', 'text', 'created_at', 'author__username'
+    )
     form = CommentForm() if request.user.is_authenticated else None
 
     context = {
@@ -64,33 +142,17 @@ def post_detail(request, post_id):
     return render(request, template, context)
 
 
-def category_posts(request, category_slug):
+class CategoryPostsView(PublishedPostListView):
     """Страница категории с пагинацией"""
 
-    template = 'blog/category.html'
+    template_name = 'blog/category.html'
 
-    category = get_object_or_404(
-        Category,
-        slug=category_slug,
-        is_published=True
-    )
+    def get_queryset(self):
+        self.category = get_published_category(self.kwargs['category_slug'])
+        return super().get_queryset().filter(category=self.category)
 
-    post_list = (
-        get_published_posts()
-        .filter(category=category)
-    ).order_by('-pub_date')
-
-    paginator = Paginator(post_list, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-
-    context = {
-        'category': category,
-        'post_list': post_list,
-        'page_obj': page_obj
-    }
-
-    return render(request, template, context)
+    def get_context_data(self, **kwargs):
+        return super().get_context_data(category=self.category, **kwargs)
 
 
 def register(request):
@@ -109,29 +171,23 @@ def register(request):
     return render(request, template, {'form': form})
 
 
-def user_profile(request, username):
+class ProfileView(PublishedPostListView):
     """Страница профиля пользователя с пагинацией"""
 
-    template = 'blog/profile.html'
-
-    profile = get_object_or_404(User, username=username)
+    template_name = 'blog/profile.html'
 
-    if request.user == profile:
-        post_list = Post.objects.filter(author=profile).select_related(
-            'category', 'location', 'author'
-        ).annotate(comment_count=Count('comments')).order_by('-pub_date')
-    else:
-        post_list = get_published_posts().filter(author=profile).annotate(comment_count=Count('comments')).order_by('-pub_date')
+    def get_queryset(self):
+        self.profile = get_object_or_404(
+            User, username=self.kwargs['username']
+        )
+        if self.request.user == self.profile:
+            return self.prepare_queryset(
+                Post.objects.filter(author_id=self.profile.id)
+            )
+        return super().get_queryset().filter(author_id=self.profile.id)
 
-
-    paginator = Paginator(post_list, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-
-    return render(request, template, {
-        'profile': profile,
-        'page_obj': page_obj
-    })
+    def get_context_data(self, **kwargs):
+        return super().get_context_data(profile=self.profile, **kwargs)
 
 
 @login_required
@@ -176,8 +232,8 @@ def edit_post(request, post_id):
 
     template = 'blog/create.html'
     
-    post = get_object_or_404(Post, id=post_id)
-    if post.author != request.user:
+    post = get_object_or_404(Post.objects.only(*POST_FORM_FIELDS), id=post_id)
+    if post.author_id != request.user.id:
         return redirect('blog:post_detail', post_id=post_id)
 
     if request.method == 'POST':
@@ -197,8 +253,8 @@ def delete_post(request, post_id):
 
     template = 'blog/create.html'
 
-    post = get_object_or_404(Post, id=post_id)
-    if post.author != request.user:
+    post = get_object_or_404(Post.objects.only(*POST_FORM_FIELDS), id=post_id)
+    if post.author_id != request.user.id:
         return redirect('blog:post_detail', post_id=post_id)
 
     if request.method == 'POST':
@@ -230,8 +286,12 @@ def edit_comment(request, post_id, comment_id):
 
     template = 'blog/comment.html'
 
-    comment = get_object_or_404(Comment, id=comment_id, post_id=post_id)
-    if comment.author != request.user:
+    comment = get_object_or_404(
+        Comment.objects.only('id', 'text', 'post', 'author', 'created_at'),
+        id=comment_id,
+        post_id=post_id
+    )
+    if comment.author_id != request.user.id:
         return redirect('blog:post_detail', post_id=post_id)
 
     if request.method == 'POST':
@@ -254,8 +314,12 @@ def delete_comment(request, post_id, comment_id):
 
     template = 'blog/comment.html'
 
-    comment = get_object_or_404(Comment, id=comment_id, post_id=post_id)
-    if comment.author != request.user:
+    comment = get_object_or_404(
+        Comment.objects.only('id', 'text', 'post', 'author', 'created_at'),
+        id=comment_id,
+        post_id=post_id
+    )
+    if comment.author_id != request.user.id:
         return redirect('blog:post_detail', post_id=post_id)
 
     if request.method == 'POST':
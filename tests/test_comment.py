@@ -8,6 +8,7 @@ import pytest
 import pytz
 from django.db.models import TextField, DateTimeField, ForeignKey, Model
 from django.forms import BaseForm
+from django.urls import reverse
 from django.utils import timezone
 
 from adapters.post import PostModelAdapter
@@ -298,3 +299,58 @@ def test_404_on_comment_deleted_post(
         ),
         assert_created=False,
     )
+
+
+@pytest.mark.django_db
+def test_short_comment_is_rejected(
+        user_client: django.test.client.Client,
+        post_with_published_location: Any,
+        CommentModel: Type[Model],
+):
+    response = user_client.post(
+        reverse("blog:add_comment", args=(post_with_published_location.id,)),
+        data={"text": "Ок"},
+    )
+    assert response.status_code == HTTPStatus.FOUND, (
+        "Убедитесь, что слишком короткий комментарий не приводит к ошибке "
+        "сервера и пользователь перенаправляется на страницу поста."
+    )
+    assert not CommentModel.objects.exists(), (
+        "Убедитесь, что слишком короткий комментарий не сохраняется."
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_follows_comments(
+        mixer, user: Model, CommentModel: Type[Model],
+):
+    first_post, second_post = mixer.cycle(2).blend("blog.Post", author=user)
+
+    def counts():
+        first_post.refresh_from_db()
+        second_post.refresh_from_db()
+        return first_post.comment_count, second_post.comment_count
+
+    comment = CommentModel.objects.create(
+        text="Первый комментарий", post=first_post, author=user
+    )
+    assert counts() == (1, 0), (
+        "Убедитесь, что при создании комментария счётчик комментариев "
+        "поста увеличивается."
+    )
+    comment.post = second_post
+    comment.save()
+    assert counts() == (0, 1), (
+        "Убедитесь, что при переносе комментария к другому посту счётчики "
+        "комментариев обоих постов обновляются."
+    )
+    comment.text = "Исправленный комментарий"
+    comment.save()
+    assert counts() == (0, 1), (
+        "Убедитесь, что редактирование комментария не меняет счётчики."
+    )
+    comment.delete()
+    assert counts() == (0, 0), (
+        "Убедитесь, что при удалении комментария счётчик комментариев "
+        "поста уменьшается."
+    )
@@ -1,13 +1,17 @@
 import inspect
 from abc import abstractmethod, ABC
+from datetime import timedelta
 from typing import Type, Optional, Callable, List, Tuple, Union
 
 import pytest
 from bs4 import BeautifulSoup
 from bs4.element import SoupStrainer
+from django.core.cache import cache
 from django.db.models import Model
 from django.http import HttpResponse
 from django.test.client import Client
+from django.urls import reverse
+from django.utils import timezone
 from mixer.main import Mixer
 
 from adapters.model_adapter import ModelAdapter
@@ -576,3 +580,55 @@ class TestContent:
             assert (
                 img_n_with_post_img[i] - img_n_without_post_img
             ) == 1, tester.image_display_error
+
+
+def test_index_cache_for_anonymous(
+        mixer: Mixer, user, unlogged_client: Client, monkeypatch
+):
+    from blog import views
+    from blog.cache_keys import INDEX_CACHE_KEY, POSTS_VERSION_KEY
+
+    cache.clear()
+    monkeypatch.setattr(views, "INDEX_CACHED_PAGES", 1)
+    posts = mixer.cycle(N_PER_PAGE + 1).blend(
+        "blog.Post",
+        author=user,
+        is_published=True,
+        category__is_published=True,
+        pub_date=timezone.now() - timedelta(days=1),
+    )
+    post = posts[0]
+    index_url = reverse("blog:index")
+
+    unlogged_client.get(index_url)
+    type(post).objects.filter(pk=post.pk).update(title="Заголовок из базы")
+    response = unlogged_client.get(index_url)
+    assert "Заголовок из базы" not in response.content.decode(), (
+        "Убедитесь, что анонимным пользователям главная страница "
+        "отдаётся из кэша."
+    )
+
+    post.title = "Сохранённый заголовок"
+    post.save()
+    response = unlogged_client.get(index_url)
+    assert "Сохранённый заголовок" in response.content.decode(), (
+        "Убедитесь, что кэш главной страницы сбрасывается при сохранении "
+        "поста."
+    )
+
+    user.username = "renamed_author"
+    user.save()
+    response = unlogged_client.get(index_url)
+    assert "@renamed_author" in response.content.decode(), (
+        "Убедитесь, что кэш главной страницы сбрасывается при изменении "
+        "автора."
+    )
+
+    unlogged_client.get(index_url, {"page": 2})
+    page_2_key = INDEX_CACHE_KEY.format(
+        version=cache.get(POSTS_VERSION_KEY, 0), page=2
+    )
+    assert cache.get(page_2_key) is None, (
+        "Убедитесь, что страницы ленты за пределами INDEX_CACHED_PAGES "
+        "не кэшируются."
+    )
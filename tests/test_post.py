@@ -11,9 +11,11 @@ import pytz
 from django.db.models import Model, ImageField, DateTimeField
 from django.forms import BaseForm
 from django.http import HttpResponse
+from django.urls import reverse
 from django.utils import timezone
 
 from adapters.post import PostModelAdapter
+from blog.forms import PostForm
 from blog.models import Post
 from conftest import (
     _TestModelAttrs,
@@ -369,3 +371,47 @@ def _test_edit_post(
         **update_props,
     )
     return edit_response, edit_url, del_url
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("field", "model", "params"),
+    [
+        ("category", "blog.Category", {"is_published": True}),
+        ("location", "blog.Location", {"is_published": True}),
+    ],
+    ids=["category", "location"]
+)
+def test_post_form_choices_include_new_item(mixer, field, model, params):
+    PostForm()
+    item = mixer.blend(model, **params)
+    choices = dict(PostForm().fields[field].choices)
+    assert item.pk in choices, (
+        f"Убедитесь, что в поле `{field}` формы создания поста доступны "
+        "и только что созданные объекты."
+    )
+
+
+@pytest.mark.django_db
+def test_unpublished_future_post_shows_pub_date_error(
+        user_client: django.test.Client,
+        published_category: Model,
+        published_location: Model,
+):
+    pub_date = timezone.localtime() + datetime.timedelta(days=1)
+    response = user_client.post(reverse("blog:create_post"), data={
+        "title": "Отложенный пост",
+        "text": "Текст отложенного поста",
+        "pub_date": pub_date.strftime("%Y-%m-%dT%H:%M"),
+        "category": published_category.pk,
+        "location": published_location.pk,
+    })
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что форма снятого с публикации поста с будущей датой "
+        "отображается повторно, а не приводит к ошибке сервера."
+    )
+    assert "pub_date" in response.context["form"].errors, (
+        "Убедитесь, что для снятого с публикации поста с будущей датой "
+        "форма сообщает об ошибке в поле `pub_date`."
+    )
+    assert not Post.objects.exists()